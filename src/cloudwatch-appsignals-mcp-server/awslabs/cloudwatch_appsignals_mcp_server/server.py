@@ -125,7 +125,7 @@ async def list_monitored_services() -> str:
             logger.warning('No services found in Application Signals')
             return 'No services found in Application Signals.'
 
-        result = f'Application Signals Services ({len(services)} total):\n\n'
+        parts = [f'Application Signals Services ({len(services)} total):\n\n']
 
         for service in services:
             # Extract service name from KeyAttributes
@@ -133,17 +133,18 @@ async def list_monitored_services() -> str:
             service_name = key_attrs.get('Name', 'Unknown')
             service_type = key_attrs.get('Type', 'Unknown')
 
-            result += f'• Service: {service_name}\n'
-            result += f'  Type: {service_type}\n'
+            parts.append(f'• Service: {service_name}\n')
+            parts.append(f'  Type: {service_type}\n')
 
             # Add key attributes
             if key_attrs:
-                result += '  Key Attributes:\n'
+                parts.append('  Key Attributes:\n')
                 for key, value in key_attrs.items():
-                    result += f'    {key}: {value}\n'
+                    parts.append(f'    {key}: {value}\n')
 
-            result += '\n'
+            parts.append('\n')
 
+        result = ''.join(parts)
         elapsed_time = timer() - start_time_perf
         logger.debug(f'list_monitored_services completed in {elapsed_time:.3f}s')
         return result
@@ -216,48 +217,49 @@ async def get_service_detail(
         service_details = service_response['Service']
 
         # Build detailed response
-        result = f'Service Details: {service_name}\n\n'
+        parts = [f'Service Details: {service_name}\n\n']
 
         # Key Attributes
         key_attrs = service_details.get('KeyAttributes', {})
         if key_attrs:
-            result += 'Key Attributes:\n'
+            parts.append('Key Attributes:\n')
             for key, value in key_attrs.items():
-                result += f'  {key}: {value}\n'
-            result += '\n'
+                parts.append(f'  {key}: {value}\n')
+            parts.append('\n')
 
         # Attribute Maps (Platform, Application, Telemetry info)
         attr_maps = service_details.get('AttributeMaps', [])
         if attr_maps:
-            result += 'Additional Attributes:\n'
+            parts.append('Additional Attributes:\n')
             for attr_map in attr_maps:
                 for key, value in attr_map.items():
-                    result += f'  {key}: {value}\n'
-            result += '\n'
+                    parts.append(f'  {key}: {value}\n')
+            parts.append('\n')
 
         # Metric References
         metric_refs = service_details.get('MetricReferences', [])
         if metric_refs:
-            result += f'Metric References ({len(metric_refs)} total):\n'
+            parts.append(f'Metric References ({len(metric_refs)} total):\n')
             for metric in metric_refs:
-                result += f'  • {metric.get("Namespace", "")}/{metric.get("MetricName", "")}\n'
-                result += f'    Type: {metric.get("MetricType", "")}\n'
+                parts.append(f'  • {metric.get("Namespace", "")}/{metric.get("MetricName", "")}\n')
+                parts.append(f'    Type: {metric.get("MetricType", "")}\n')
                 dimensions = metric.get('Dimensions', [])
                 if dimensions:
-                    result += '    Dimensions: '
+                    parts.append('    Dimensions: ')
                     dim_strs = [f'{d["Name"]}={d["Value"]}' for d in dimensions]
-                    result += ', '.join(dim_strs) + '\n'
-                result += '\n'
+                    parts.append(', '.join(dim_strs) + '\n')
+                parts.append('\n')
 
         # Log Group References
         log_refs = service_details.get('LogGroupReferences', [])
         if log_refs:
-            result += f'Log Group References ({len(log_refs)} total):\n'
+            parts.append(f'Log Group References ({len(log_refs)} total):\n')
             for log_ref in log_refs:
                 log_group = log_ref.get('Identifier', 'Unknown')
-                result += f'  • {log_group}\n'
-            result += '\n'
+                parts.append(f'  • {log_group}\n')
+            parts.append('\n')
 
+        result = ''.join(parts)
         elapsed_time = timer() - start_time_perf
         logger.debug(f"get_service_detail completed for '{service_name}' in {elapsed_time:.3f}s")
         return result
@@ -360,13 +362,13 @@ async def query_service_metrics(
 
         # If no specific metric requested, show available metrics
         if not metric_name:
-            result = f"Available metrics for service '{service_name}':\n\n"
+            parts = [f"Available metrics for service '{service_name}':\n\n"]
             for metric in metric_refs:
-                result += f'• {metric.get("MetricName", "Unknown")}\n'
-                result += f'  Namespace: {metric.get("Namespace", "Unknown")}\n'
-                result += f'  Type: {metric.get("MetricType", "Unknown")}\n'
-                result += '\n'
-            return result
+                parts.append(f'• {metric.get("MetricName", "Unknown")}\n')
+                parts.append(f'  Namespace: {metric.get("Namespace", "Unknown")}\n')
+                parts.append(f'  Type: {metric.get("MetricType", "Unknown")}\n')
+                parts.append('\n')
+            return ''.join(parts)
 
         # Find the specific metric
         target_metric = None
@@ -411,9 +413,11 @@ async def query_service_metrics(
         datapoints.sort(key=lambda x: x.get('Timestamp', datetime.min))  # type: ignore
 
         # Build response
-        result = f'Metrics for {service_name} - {metric_name}\n'
-        result += f'Time Range: Last {hours} hour(s)\n'
-        result += f'Period: {period} seconds\n\n'
+        parts = [
+            f'Metrics for {service_name} - {metric_name}\n',
+            f'Time Range: Last {hours} hour(s)\n',
+            f'Period: {period} seconds\n\n',
+        ]
 
         # Calculate summary statistics for both standard and extended statistics
         standard_values = [dp.get(statistic) for dp in datapoints if dp.get(statistic) is not None]
@@ -423,7 +427,7 @@ async def query_service_metrics(
             if dp.get(extended_statistic) is not None
         ]
 
-        result += 'Summary:\n'
+        parts.append('Summary:\n')
 
         if standard_values:
             latest_standard = datapoints[-1].get(statistic)
@@ -431,11 +435,11 @@ async def query_service_metrics(
             max_standard = max(standard_values)  # type: ignore
             min_standard = min(standard_values)  # type: ignore
 
-            result += f'{statistic} Statistics:\n'
-            result += f'• Latest: {latest_standard:.2f}\n'
-            result += f'• Average: {avg_of_standard:.2f}\n'
-            result += f'• Maximum: {max_standard:.2f}\n'
-            result += f'• Minimum: {min_standard:.2f}\n\n'
+            parts.append(f'{statistic} Statistics:\n')
+            parts.append(f'• Latest: {latest_standard:.2f}\n')
+            parts.append(f'• Average: {avg_of_standard:.2f}\n')
+            parts.append(f'• Maximum: {max_standard:.2f}\n')
+            parts.append(f'• Minimum: {min_standard:.2f}\n\n')
 
         if extended_values:
             latest_extended = datapoints[-1].get(extended_statistic)
@@ -443,16 +447,16 @@ async def query_service_metrics(
             max_extended = max(extended_values)  # type: ignore
             min_extended = min(extended_values)  # type: ignore
 
-            result += f'{extended_statistic} Statistics:\n'
-            result += f'• Latest: {latest_extended:.2f}\n'
-            result += f'• Average: {avg_extended:.2f}\n'
-            result += f'• Maximum: {max_extended:.2f}\n'
-            result += f'• Minimum: {min_extended:.2f}\n\n'
+            parts.append(f'{extended_statistic} Statistics:\n')
+            parts.append(f'• Latest: {latest_extended:.2f}\n')
+            parts.append(f'• Average: {avg_extended:.2f}\n')
+            parts.append(f'• Maximum: {max_extended:.2f}\n')
+            parts.append(f'• Minimum: {min_extended:.2f}\n\n')
 
-        result += f'• Data Points: {len(datapoints)}\n\n'
+        parts.append(f'• Data Points: {len(datapoints)}\n\n')
 
         # Show recent values (last 10) with both metrics
-        result += 'Recent Values:\n'
+        parts.append('Recent Values:\n')
         for dp in datapoints[-10:]:
             timestamp = dp.get('Timestamp', datetime.min).strftime('%m/%d %H:%M')  # type: ignore
             unit = dp.get('Unit', '')
@@ -463,8 +467,9 @@ async def query_service_metrics(
             if dp.get(extended_statistic) is not None:
                 values_str.append(f'{extended_statistic}: {dp[extended_statistic]:.2f}')
 
-            result += f'• {timestamp}: {", ".join(values_str)} {unit}\n'
+            parts.append(f'• {timestamp}: {", ".join(values_str)} {unit}\n')
 
+        result = ''.join(parts)
         elapsed_time = timer() - start_time_perf
         logger.info(
             f"query_service_metrics completed for '{service_name}/{metric_name}' in {elapsed_time:.3f}s"
@@ -27,8 +27,8 @@ from awslabs.ecs_mcp_server.utils.aws import get_aws_client
 
 logger = logging.getLogger(__name__)
 
-# List of supported ECS API operations
-SUPPORTED_ECS_OPERATIONS = [
+# Supported ECS API operations, in the order they are reported to callers
+SUPPORTED_ECS_OPERATIONS = (
     "CreateCapacityProvider",
     "CreateCluster",
     "CreateService",
@@ -89,7 +89,10 @@ SUPPORTED_ECS_OPERATIONS = [
     "UpdateServicePrimaryTaskSet",
     "UpdateTaskProtection",
     "UpdateTaskSet",
-]
+)
+
+# Frozen set for O(1) membership checks when validating operations
+_SUPPORTED_ECS_OPERATIONS_SET = frozenset(SUPPORTED_ECS_OPERATIONS)
 
 
 def camel_to_snake(name):
@@ -97,7 +100,7 @@ def camel_to_snake(name):
     Convert CamelCase to snake_case.
 
     This function is used to convert AWS API operation names from their CamelCase format
-    (as documented in AWS API references and used in our SUPPORTED_ECS_OPERATIONS list)
+    (as documented in AWS API references and used in our SUPPORTED_ECS_OPERATIONS table)
     to the snake_case format required by boto3 client methods.
 
     Examples:
@@ -131,7 +134,7 @@ async def ecs_api_operation(api_operation: str, api_params: Dict[str, Any]) -> D
         All other operations require WRITE permission (ALLOW_WRITE=true).
     """
     # Validate the API operation
-    if api_operation not in SUPPORTED_ECS_OPERATIONS:
+    if api_operation not in _SUPPORTED_ECS_OPERATIONS_SET:
         supported_ops = ", ".join(SUPPORTED_ECS_OPERATIONS)
         raise ValueError(
             f"Unsupported API operation: {api_operation}. Must be one of: {supported_ops}"
@@ -14,12 +14,17 @@
 
 """File utility functions for the frontend MCP server."""
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def load_markdown_file(filename: str) -> str:
     """Load a markdown file from the static/react directory.
 
+    The static files never change at runtime, so results are cached and each
+    file is read from disk at most once per process.
+
     Args:
         filename (str): The name of the markdown file to load (e.g. 'basic-ui-setup.md')
 
@@ -22,6 +22,7 @@ from unittest.mock import mock_open, patch
 def test_load_markdown_file_success(mock_file_open, mock_exists):
     """Test load_markdown_file returns content when file exists."""
     # Arrange
+    load_markdown_file.cache_clear()
     mock_exists.return_value = True
 
     # Act
@@ -38,6 +39,7 @@ def test_load_markdown_file_success(mock_file_open, mock_exists):
 def test_load_markdown_file_not_found(mock_print, mock_exists):
     """Test load_markdown_file returns empty string and prints warning when file not found."""
     # Arrange
+    load_markdown_file.cache_clear()
     mock_exists.return_value = False
 
     # Act
@@ -48,3 +50,21 @@ def test_load_markdown_file_not_found(mock_print, mock_exists):
     assert mock_print.called
     assert 'Warning: File not found:' in mock_print.call_args[0][0]
     assert result == ''
+
+
+@patch('pathlib.Path.exists')
+@patch('builtins.open', new_callable=mock_open, read_data='Cached content')
+def test_load_markdown_file_caches_result(mock_file_open, mock_exists):
+    """Test load_markdown_file reads a file only once for repeated calls."""
+    # Arrange
+    load_markdown_file.cache_clear()
+    mock_exists.return_value = True
+
+    # Act
+    first = load_markdown_file('cached-file.md')
+    second = load_markdown_file('cached-file.md')
+
+    # Assert
+    assert first == 'Cached content'
+    assert second == 'Cached content'
+    mock_file_open.assert_called_once()
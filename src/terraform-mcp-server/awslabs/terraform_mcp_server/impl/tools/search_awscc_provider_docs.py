@@ -126,7 +126,7 @@ def fetch_github_documentation(
     Returns:
         Dictionary with markdown content and metadata, or None if not found
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(f"[{correlation_id}] Fetching documentation from GitHub for '{asset_name}'")
 
     # Create a cache key that includes both asset_name and asset_type
@@ -184,7 +184,7 @@ def fetch_github_documentation(
         if cache_enabled:
             _GITHUB_DOC_CACHE[cache_key] = result
 
-        fetch_time = time.time() - start_time
+        fetch_time = time.perf_counter() - start_time
         logger.info(f'[{correlation_id}] GitHub documentation fetched in {fetch_time:.2f} seconds')
         return result
 
@@ -219,7 +219,7 @@ def parse_markdown_documentation(
     Returns:
         Dictionary with parsed documentation details
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.debug(f"[{correlation_id}] Parsing markdown documentation for '{asset_name}'")
 
     try:
@@ -417,7 +417,7 @@ def parse_markdown_documentation(
             logger.debug(f'[{correlation_id}] No Schema section found')
 
         # Return the parsed information
-        parse_time = time.time() - start_time
+        parse_time = time.perf_counter() - start_time
         logger.debug(f'[{correlation_id}] Markdown parsing completed in {parse_time:.2f} seconds')
 
         return {
@@ -484,8 +484,8 @@ async def search_awscc_provider_docs_impl(
         - Example code snippets
         - Schema information (required, optional, read-only, and nested structures attributes)
     """
-    start_time = time.time()
-    correlation_id = f'search-{int(start_time * 1000)}'
+    start_time = time.perf_counter()
+    correlation_id = f'search-{int(time.time() * 1000)}'
     logger.info(f"[{correlation_id}] Starting AWSCC provider docs search for '{asset_name}'")
 
     # Validate input parameters
@@ -569,7 +569,7 @@ async def search_awscc_provider_docs_impl(
 
             if results:
                 logger.info(f'[{correlation_id}] Found {len(results)} documentation entries')
-                end_time = time.time()
+                end_time = time.perf_counter()
                 logger.info(
                     f'[{correlation_id}] Search completed in {end_time - start_time:.2f} seconds (GitHub source)'
                 )
@@ -593,7 +593,7 @@ async def search_awscc_provider_docs_impl(
                     schema_arguments=github_result.get('schema_arguments'),
                 )
 
-                end_time = time.time()
+                end_time = time.perf_counter()
                 logger.info(
                     f'[{correlation_id}] Search completed in {end_time - start_time:.2f} seconds (GitHub source)'
                 )
@@ -604,7 +604,7 @@ async def search_awscc_provider_docs_impl(
 
         # Return a "not found" result
         logger.warning(f'[{correlation_id}] No documentation found for asset {asset_name}')
-        end_time = time.time()
+        end_time = time.perf_counter()
         logger.info(
             f'[{correlation_id}] Search completed in {end_time - start_time:.2f} seconds (no results)'
         )
@@ -625,7 +625,7 @@ async def search_awscc_provider_docs_impl(
         )
         # Don't log the full stack trace to avoid information disclosure
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         logger.info(f'[{correlation_id}] Search failed in {end_time - start_time:.2f} seconds')
 
         # Return a generic error message without exposing internal details
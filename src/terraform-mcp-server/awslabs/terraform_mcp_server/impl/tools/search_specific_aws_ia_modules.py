@@ -180,11 +180,11 @@ async def get_module_details(namespace: str, name: str, provider: str = 'aws') -
                                 logger.info(
                                     f'Fetching submodules using {found_readme_branch} branch'
                                 )
-                                start_time = time.time()
+                                start_time = time.perf_counter()
                                 submodules = await get_submodules(owner, repo, found_readme_branch)
                                 if submodules:
                                     logger.info(
-                                        f'Found {len(submodules)} submodules in {time.time() - start_time:.2f} seconds'
+                                        f'Found {len(submodules)} submodules in {time.perf_counter() - start_time:.2f} seconds'
                                     )
                                     details['submodules'] = [
                                         submodule.dict() for submodule in submodules
@@ -195,11 +195,11 @@ async def get_module_details(namespace: str, name: str, provider: str = 'aws') -
                                 # Try both main branches for submodules if readme wasn't found
                                 for branch in ['main', 'master']:
                                     logger.debug(f'Trying {branch} branch for submodules')
-                                    start_time = time.time()
+                                    start_time = time.perf_counter()
                                     submodules = await get_submodules(owner, repo, branch)
                                     if submodules:
                                         logger.info(
-                                            f'Found {len(submodules)} submodules in {branch} branch in {time.time() - start_time:.2f} seconds'
+                                            f'Found {len(submodules)} submodules in {branch} branch in {time.perf_counter() - start_time:.2f} seconds'
                                         )
                                         details['submodules'] = [
                                             submodule.dict() for submodule in submodules
@@ -21,9 +21,16 @@ import time
 import traceback
 from awslabs.terraform_mcp_server.models import SubmoduleInfo, TerraformVariable
 from loguru import logger
+from requests.adapters import HTTPAdapter
 from typing import Any, Dict, List, Optional, Tuple
 
 
+# Shared session so the registry/GitHub calls below reuse pooled connections
+# instead of opening a fresh TCP+TLS connection per request.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+
 def clean_description(description: str) -> str:
     """Remove emoji characters from description strings.
 
@@ -72,7 +79,7 @@ async def get_github_release_details(owner: str, repo: str) -> Dict[str, Any]:
     logger.debug(f'Making request to GitHub releases API: {release_url}')
 
     try:
-        response = requests.get(release_url)
+        response = _session.get(release_url)
         logger.debug(f'GitHub releases API response code: {response.status_code}')
 
         if response.status_code == 200:
@@ -102,7 +109,7 @@ async def get_github_release_details(owner: str, repo: str) -> Dict[str, Any]:
     logger.debug(f'No releases found, trying tags: {tags_url}')
 
     try:
-        response = requests.get(tags_url)
+        response = _session.get(tags_url)
         logger.debug(f'GitHub tags API response code: {response.status_code}')
 
         if response.status_code == 200 and response.json():
@@ -153,13 +160,13 @@ async def get_submodules(owner: str, repo: str, branch: str = 'master') -> List[
 
     try:
         # Get list of directories in /modules
-        start_time = time.time()
-        response = requests.get(
+        start_time = time.perf_counter()
+        response = _session.get(
             modules_url,
             headers={'Accept': 'application/vnd.github.v3+json'},
             timeout=3.0,  # Add timeout
         )
-        logger.debug(f'GitHub API request took {time.time() - start_time:.2f} seconds')
+        logger.debug(f'GitHub API request took {time.perf_counter() - start_time:.2f} seconds')
 
         if response.status_code == 404:
             logger.debug(f'No modules directory found in {branch} branch')
@@ -210,9 +217,9 @@ async def get_submodules(owner: str, repo: str, branch: str = 'master') -> List[
             logger.debug(f'Fetching README for submodule {name}: {readme_url}')
 
             try:
-                start_time = time.time()
-                readme_response = requests.get(readme_url, timeout=2.0)  # Add timeout
-                logger.debug(f'README fetch took {time.time() - start_time:.2f} seconds')
+                start_time = time.perf_counter()
+                readme_response = _session.get(readme_url, timeout=2.0)  # Add timeout
+                logger.debug(f'README fetch took {time.perf_counter() - start_time:.2f} seconds')
 
                 if readme_response.status_code == 200:
                     readme_content = readme_response.text
@@ -239,7 +246,7 @@ async def get_submodules(owner: str, repo: str, branch: str = 'master') -> List[
                     lowercase_readme_url = f'https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}/readme.md'
                     logger.debug(f'Trying lowercase readme.md: {lowercase_readme_url}')
 
-                    lowercase_response = requests.get(lowercase_readme_url, timeout=2.0)
+                    lowercase_response = _session.get(lowercase_readme_url, timeout=2.0)
                     if lowercase_response.status_code == 200:
                         readme_content = lowercase_response.text
                         if len(readme_content) > 8000:
@@ -412,9 +419,9 @@ async def get_variables_tf(
     logger.debug(f'Fetching variables.tf: {variables_url}')
 
     try:
-        start_time = time.time()
-        response = requests.get(variables_url, timeout=3.0)
-        logger.debug(f'variables.tf fetch took {time.time() - start_time:.2f} seconds')
+        start_time = time.perf_counter()
+        response = _session.get(variables_url, timeout=3.0)
+        logger.debug(f'variables.tf fetch took {time.perf_counter() - start_time:.2f} seconds')
 
         if response.status_code == 200:
             variables_content = response.text
@@ -436,7 +443,7 @@ async def get_variables_tf(
                 master_variables_url = (
                     f'https://raw.githubusercontent.com/{owner}/{repo}/master/variables.tf'
                 )
-                master_response = requests.get(master_variables_url, timeout=3.0)
+                master_response = _session.get(master_variables_url, timeout=3.0)
 
                 if master_response.status_code == 200:
                     variables_content = master_response.text
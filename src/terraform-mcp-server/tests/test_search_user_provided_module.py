@@ -887,8 +887,9 @@ async def test_get_module_details_no_readme_content(mock_requests_get):
             assert 'readme_content' not in result
 
 
+@patch('requests.Session.get')
 @patch('requests.get')
-async def test_get_module_details_with_variables_content(mock_requests_get):
+async def test_get_module_details_with_variables_content(mock_requests_get, mock_session_get):
     """Test get_module_details when variables are found in variables.tf."""
     # Setup mock for registry API response with GitHub source URL
     registry_response = MockResponse(
@@ -939,6 +940,7 @@ variable "num_servers" {
             return MockResponse(404)
 
     mock_requests_get.side_effect = mock_get_side_effect
+    mock_session_get.side_effect = mock_get_side_effect
 
     # Skip mocking get_variables_tf and directly use the implementation
     # This will ensure the variables_content is processed correctly
@@ -959,8 +961,11 @@ variable "num_servers" {
     assert result['variables'][1]['default'] == '3'
 
 
+@patch('requests.Session.get')
 @patch('requests.get')
-async def test_get_module_details_with_variables_in_master_branch(mock_requests_get):
+async def test_get_module_details_with_variables_in_master_branch(
+    mock_requests_get, mock_session_get
+):
     """Test get_module_details when variables are found in master branch (fallback)."""
     # Setup mock for registry API response with GitHub source URL
     registry_response = MockResponse(
@@ -1007,6 +1012,7 @@ variable "cluster_name" {
             return MockResponse(404)
 
     mock_requests_get.side_effect = mock_get_side_effect
+    mock_session_get.side_effect = mock_get_side_effect
 
     # Call the function
     result = await get_module_details('hashicorp', 'consul', 'aws', '0.11.0')
@@ -1022,8 +1028,9 @@ variable "cluster_name" {
     assert result['variables'][0]['required'] is True
 
 
+@patch('requests.Session.get')
 @patch('requests.get')
-async def test_get_module_details_with_version_from_github(mock_requests_get):
+async def test_get_module_details_with_version_from_github(mock_requests_get, mock_session_get):
     """Test get_module_details when version is found from GitHub and no module version is set."""
     # Setup mock for registry API response with GitHub source URL but no version
     registry_response = MockResponse(
@@ -1067,6 +1074,7 @@ async def test_get_module_details_with_version_from_github(mock_requests_get):
         return MockResponse(404)
 
     mock_requests_get.side_effect = mock_get_side_effect
+    mock_session_get.side_effect = mock_get_side_effect
 
     # Call the function directly without mocking get_github_release_details
     # This will test the actual code path that sets the version from GitHub